@@ -4,8 +4,35 @@ import sys
 import json
 import logging
 import re
+import time
+import math
+import gzip
+import atexit
+import hashlib
+import asyncio
+import threading
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter, Retry
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Hoisted so the encoding tables are built once, not per prompt.
+ENC = tiktoken.encoding_for_model("gpt-4o-mini") if tiktoken else None
+from selectolax.lexbor import LexborHTMLParser
 from urllib.parse import urljoin, urlparse
 from dotenv import load_dotenv
 import openai
@@ -23,21 +50,61 @@ MAGENTA = "\033[1;35m"
 CYAN = "\033[1;36m"
 RESET = "\033[0m"
 
+
+def green_bracket(key):
+    """
+    Colorize a menu option key once, e.g. green_bracket("1") -> green "[1]".
+    """
+    return f"{GREEN}[{key}]{RESET}"
+
 # Define HTTP headers and (optionally) proxies
 headers = {
     "User-Agent": (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
         "AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/117.0.0.0 Safari/537.36"
-    )
+    ),
+    # br is deliberately not advertised: decoding it needs the Brotli package,
+    # and without it the bodies would reach the parser still compressed.
+    "Accept-Encoding": "gzip, deflate",
 }
+
+# Read at most this much of a page. The prompt is capped well below this
+# downstream, so anything past the cap is bandwidth and parse time wasted.
+MAX_BYTES = 512 * 1024
 # Uncomment and set your proxies if needed:
 # PROXIES = {"http": "http://your-proxy", "https": "http://your-proxy"}
 PROXIES = None
 
+# Shared session so TCP+TLS handshakes are paid once per host, not once per request.
+SESSION = requests.Session()
+SESSION.headers.update(headers)
+_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.3),
+)
+SESSION.mount('https://', _adapter)
+SESSION.mount('http://', _adapter)
+
 # File where the sites list is persisted
 SITES_FILE = "sites.json"
 
+# On-disk summary cache, keyed by the SHA-256 of the scraped page text.
+# Re-running a summary over an unchanged page within the TTL skips the LLM call.
+CACHE_DIR = os.path.join(".cache", "summaries")
+CACHE_TTL_SECONDS = 6 * 60 * 60
+
+# Semantic cache: news sites republish lightly reworded versions of the same
+# story, which the exact hash above never matches. Page embeddings are kept in
+# a small on-disk index; a close-enough prior page reuses its cached summary.
+EMBEDDINGS_FILE = os.path.join(CACHE_DIR, "embeddings.json")
+EMBEDDING_MODEL = "text-embedding-3-small"
+SEMANTIC_SIMILARITY_THRESHOLD = 0.93
+
+# Cap on in-flight chat completions so concurrent runs respect rate limits.
+MAX_CONCURRENT_LLM_CALLS = 8
+
 
 def load_sites():
     """
@@ -54,7 +121,9 @@ def load_sites():
         return default_sites
     else:
         try:
-            with open(SITES_FILE, 'r', encoding='utf-8') as f:
+            with open(SITES_FILE, 'rb') as f:
+                if orjson is not None:
+                    return orjson.loads(f.read())
                 return json.load(f)
         except Exception as e:
             logging.error(f"Error reading {SITES_FILE}: {e}")
@@ -64,19 +133,47 @@ def load_sites():
 def save_sites(sites):
     """
     Save the current sites dictionary to SITES_FILE.
+    Serializes with orjson (C-speed) when available, stdlib json otherwise.
+    Writes via a temp file and os.replace so a crash mid-write can never
+    leave a corrupt sites file.
     """
+    tmp_path = SITES_FILE + ".tmp"
     try:
-        with open(SITES_FILE, 'w', encoding='utf-8') as f:
-            json.dump(sites, f, indent=4)
+        with open(tmp_path, 'wb') as f:
+            if orjson is not None:
+                f.write(orjson.dumps(sites, option=orjson.OPT_INDENT_2))
+            else:
+                f.write(json.dumps(sites, indent=4).encode('utf-8'))
+        os.replace(tmp_path, SITES_FILE)
     except Exception as e:
         logging.error(f"Error saving sites to {SITES_FILE}: {e}")
 
 
-def fetch_with_selenium(url):
+# Lazily-created headless Chrome, reused across fallback fetches. Starting a
+# browser costs hundreds of ms, so one broken site per run is paid once, not
+# N times. The lock serializes use when pages are parsed from worker threads.
+_SELENIUM_DRIVER = None
+_SELENIUM_LOCK = threading.Lock()
+
+
+def _quit_selenium_driver():
+    global _SELENIUM_DRIVER
+    if _SELENIUM_DRIVER is not None:
+        try:
+            _SELENIUM_DRIVER.quit()
+        except Exception:
+            pass
+        _SELENIUM_DRIVER = None
+
+
+def _get_selenium_driver():
     """
-    Use Selenium (with headless Chrome) to fetch pages that require JavaScript.
-    Make sure selenium and the appropriate WebDriver are installed.
+    Return the shared headless Chrome driver, starting it on first use.
+    Returns None if selenium is missing or the driver cannot start.
     """
+    global _SELENIUM_DRIVER
+    if _SELENIUM_DRIVER is not None:
+        return _SELENIUM_DRIVER
     try:
         from selenium import webdriver
         from selenium.webdriver.chrome.options import Options
@@ -87,108 +184,170 @@ def fetch_with_selenium(url):
     options = Options()
     options.add_argument("--headless")
     options.add_argument("--disable-gpu")
+    options.add_argument("--no-sandbox")
+    # Pages are only scraped for text, so skip image loading to cut render cost.
+    options.add_argument("--blink-settings=imagesEnabled=false")
     try:
-        driver = webdriver.Chrome(options=options)
+        _SELENIUM_DRIVER = webdriver.Chrome(options=options)
     except Exception as e:
         logging.error(f"Error initializing Selenium WebDriver: {e}")
         return None
+    atexit.register(_quit_selenium_driver)
+    return _SELENIUM_DRIVER
 
+
+def fetch_with_selenium(url):
+    """
+    Use Selenium (with headless Chrome) to fetch pages that require JavaScript.
+    Make sure selenium and the appropriate WebDriver are installed.
+    """
+    with _SELENIUM_LOCK:
+        driver = _get_selenium_driver()
+        if driver is None:
+            return None
+        try:
+            driver.get(url)
+            return driver.page_source
+        except Exception as e:
+            logging.error(f"Error fetching page with Selenium: {e}")
+            # The cached Chrome session may be dead; drop it so the next
+            # fallback starts a fresh driver instead of failing forever.
+            _quit_selenium_driver()
+            return None
+
+
+def fetch_page(url):
+    """
+    Download a single page with a blocking request and return up to MAX_BYTES
+    of raw bytes. Streaming with a cap avoids materializing huge pages in
+    memory; the parsers tolerate truncated HTML.
+    """
     try:
-        driver.get(url)
-        html = driver.page_source
-    except Exception as e:
-        logging.error(f"Error fetching page with Selenium: {e}")
-        html = None
+        response = SESSION.get(url, stream=True, timeout=10, proxies=PROXIES)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        logging.error(f"Error fetching the URL via requests: {e}")
+        sys.exit(1)
+
+    content_type = response.headers.get('Content-Type', '')
+    if 'html' not in content_type:
+        logging.error("The URL did not return HTML content.")
+        sys.exit(1)
+    try:
+        return response.raw.read(MAX_BYTES, decode_content=True)
     finally:
-        driver.quit()
-    return html
+        response.close()
 
 
-def sanitize_filename(filename):
+async def _fetch_page_async(session, url):
     """
-    Sanitize the filename by removing characters not allowed in file names.
+    Download a single page on the shared aiohttp session and return the raw bytes.
     """
-    return re.sub(r'[\\/*?:"<>|]', "", filename)
+    async with session.get(url, proxy=(PROXIES or {}).get("https")) as response:
+        response.raise_for_status()
+        content_type = response.headers.get('Content-Type', '')
+        if 'html' not in content_type:
+            logging.error(f"{url} did not return HTML content.")
+            sys.exit(1)
+        return await response.content.read(MAX_BYTES)
 
 
-def is_navigation_link(a_tag):
+async def _fetch_many_async(urls):
+    timeout = aiohttp.ClientTimeout(total=10)
+    async with aiohttp.ClientSession(headers=headers, timeout=timeout) as session:
+        return await asyncio.gather(*(_fetch_page_async(session, url) for url in urls))
+
+
+def fetch_all(urls):
+    """
+    Download all URLs concurrently. The downloads are independent and I/O-bound,
+    so total wall time is roughly the slowest site instead of the sum of all
+    round trips. Uses aiohttp when available; otherwise falls back to a thread
+    pool of blocking fetches, which overlaps the waits just as well because
+    requests releases the GIL on network I/O. Returns the raw HTML bytes in
+    the same order as urls.
+    """
+    if not urls:
+        return []
+    if aiohttp is None:
+        with ThreadPoolExecutor(max_workers=min(8, len(urls))) as executor:
+            return list(executor.map(fetch_page, urls))
+    try:
+        return asyncio.run(_fetch_many_async(urls))
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        # The total timeout surfaces as asyncio.TimeoutError, not ClientError.
+        logging.error(f"Error fetching sites concurrently: {e}")
+        sys.exit(1)
+
+
+# Characters not allowed in file names, compiled once at import time.
+_FILENAME_RE = re.compile(r'[\\/*?:"<>|]')
+
+
+def sanitize_filename(filename):
     """
-    Return True if the <a> tag is inside a navigation element (nav, header, or footer).
+    Sanitize the filename by removing characters not allowed in file names.
     """
-    for parent in a_tag.parents:
-        if parent.name in ['nav', 'header', 'footer']:
-            return True
-    return False
+    return _FILENAME_RE.sub("", filename)
 
 
 class Website:
     """
-    Represents a webpage. Downloads and parses the page with BeautifulSoup,
+    Represents a webpage. Downloads and parses the page with selectolax (Lexbor),
     extracts the title, text, and also saves all URL links that appear to be part of the main story.
     If the initial request returns little content, attempts to use Selenium for JavaScript-heavy pages.
+    If html is provided (e.g. pre-fetched concurrently by fetch_all), no request is made.
     """
-    def __init__(self, url):
+    def __init__(self, url, html=None):
         self.url = url
-        # Try to fetch using requests
-        try:
-            response = requests.get(url, headers=headers, timeout=10, proxies=PROXIES)
-            response.raise_for_status()
-        except requests.RequestException as e:
-            logging.error(f"Error fetching the URL via requests: {e}")
-            sys.exit(1)
-
-        content_type = response.headers.get('Content-Type', '')
-        if 'html' not in content_type:
-            logging.error("The URL did not return HTML content.")
-            sys.exit(1)
+        if html is None:
+            html = fetch_page(url)
 
-        soup = BeautifulSoup(response.content, 'html.parser')
-        self.title = soup.title.string.strip() if soup.title and soup.title.string else "No Title"
-        self.links = []
-        if soup.body:
-            # Extract <a> tags only if they are not inside nav, header, or footer elements.
-            for a in soup.body.find_all('a', href=True):
-                if is_navigation_link(a):
-                    continue
-                link_text = a.get_text().strip() or a['href']
-                link_url = a['href']
-                if not link_url.startswith("http"):
-                    link_url = urljoin(self.url, link_url)
-                self.links.append((link_text, link_url))
-            # Now remove unwanted tags.
-            for tag in soup.body(["script", "style", "img", "input", "nav", "footer", "header"]):
-                tag.decompose()
-            self.text = soup.body.get_text(separator="\n", strip=True)
-        else:
-            self.text = ""
+        # Pass raw bytes so Lexbor can sniff the charset from the page itself.
+        self._parse(html)
 
         # If the extracted text is very short, try Selenium as a fallback.
         if not self.text.strip() or len(self.text) < 50:
             logging.info("Page content appears minimal, trying Selenium for JavaScript-heavy content...")
             html = fetch_with_selenium(url)
             if html:
-                soup = BeautifulSoup(html, 'html.parser')
-                if soup.body:
-                    self.links = []
-                    for a in soup.body.find_all('a', href=True):
-                        if is_navigation_link(a):
-                            continue
-                        link_text = a.get_text().strip() or a['href']
-                        link_url = a['href']
-                        if not link_url.startswith("http"):
-                            link_url = urljoin(self.url, link_url)
-                        self.links.append((link_text, link_url))
-                    for tag in soup.body(["script", "style", "img", "input", "nav", "footer", "header"]):
-                        tag.decompose()
-                    self.text = soup.body.get_text(separator="\n", strip=True)
-                else:
-                    self.text = ""
+                self._parse(html)
+
+    def _parse(self, html):
+        """
+        Extract the title, main-story links, and visible text from raw HTML.
+        Lexbor is a C HTML5 parser, so no Python object is built per DOM node.
+        """
+        tree = LexborHTMLParser(html)
+        title_node = tree.css_first('title')
+        title = title_node.text(strip=True) if title_node else ""
+        self.title = title or "No Title"
+        self.links = []
+        if tree.body is None:
+            self.text = ""
+            return
+        # Remove unwanted tags first. With nav/header/footer gone, every
+        # remaining anchor is part of the main story by construction, so no
+        # per-anchor ancestor walk is needed.
+        for node in tree.body.css('script, style, img, input, nav, footer, header'):
+            node.decompose()
+        for a in tree.body.css('a[href]'):
+            link_url = a.attributes.get('href') or ""
+            if not link_url:
+                continue
+            link_text = a.text(strip=True) or link_url
+            if not link_url.startswith("http"):
+                link_url = urljoin(self.url, link_url)
+            self.links.append((link_text, link_url))
+        self.text = tree.body.text(separator="\n", strip=True)
 
 
-def user_prompt_for(website, max_chars=4000):
+def user_prompt_for(website, max_tokens=3500):
     """
     Build a robust prompt for summarization including clear instructions.
-    If the text is too long, only the first max_chars characters are included.
+    Text is truncated by tokens, not characters, so the budget holds whether
+    the content is token-dense (CJK) or token-sparse (code, URLs). Falls back
+    to a character cap if tiktoken is unavailable.
     """
     prompt = f"You are analyzing the website titled '{website.title}'.\n"
     prompt += (
@@ -196,8 +355,16 @@ def user_prompt_for(website, max_chars=4000):
         "Include all key points, background details, and any news or announcements present. "
         "Your summary should be complete and detailed enough to give a full understanding of the website's content.\n\n"
     )
-    if len(website.text) > max_chars:
-        prompt += website.text[:max_chars] + "\n\n[Content truncated]"
+    if ENC is not None:
+        # disallowed_special=() treats special-token strings like
+        # <|endoftext|> in scraped text as plain text instead of raising.
+        ids = ENC.encode(website.text, disallowed_special=())
+        if len(ids) > max_tokens:
+            prompt += ENC.decode(ids[:max_tokens]) + "\n\n[Content truncated]"
+        else:
+            prompt += website.text
+    elif len(website.text) > 4000:
+        prompt += website.text[:4000] + "\n\n[Content truncated]"
     else:
         prompt += website.text
     return prompt
@@ -213,29 +380,259 @@ def messages_for(website, system_prompt):
     ]
 
 
-def summarize(url, model):
+SYSTEM_PROMPT = (
+    "You are an assistant that analyzes website content and provides a robust, complete, and comprehensive summary in markdown. "
+    "Include key details, context, and highlight any news or announcements."
+)
+
+
+def cache_key_for(website):
     """
-    Given a URL, scrape the website and get a robust summary from the OpenAI API.
-    Returns both the Website object and the summary.
+    Content-addressable cache key: the SHA-256 of the scraped page text.
     """
-    website = Website(url)
-    system_prompt = (
-        "You are an assistant that analyzes website content and provides a robust, complete, and comprehensive summary in markdown. "
-        "Include key details, context, and highlight any news or announcements."
-    )
+    return hashlib.sha256(website.text.encode('utf-8')).hexdigest()
+
+
+def cached_summary(key, model):
+    """
+    Return a cached summary for the key, or None if there is no fresh entry
+    produced by the same model.
+    """
+    path = os.path.join(CACHE_DIR, f"{key}.json")
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if entry.get("model") != model:
+        return None
+    if time.time() - entry.get("ts", 0) > CACHE_TTL_SECONDS:
+        return None
+    return entry.get("summary")
+
+
+def store_summary(key, url, model, summary):
+    """
+    Write a cache entry atomically so a crash never leaves a half-written file.
+    """
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    path = os.path.join(CACHE_DIR, f"{key}.json")
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"model": model, "url": url, "summary": summary, "ts": time.time()}, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logging.error(f"Error writing summary cache: {e}")
+
+
+def embed_text(text):
+    """
+    Embed the page text (truncated to the same budget as the prompt) with the
+    cheap embedding model. Returns None on API failure so callers can simply
+    skip the semantic cache.
+    """
+    try:
+        response = openai.embeddings.create(model=EMBEDDING_MODEL, input=text[:4000])
+    except openai.OpenAIError as e:
+        logging.error(f"OpenAI embeddings error: {e}")
+        return None
+    return response.data[0].embedding
+
+
+def load_embedding_index():
+    try:
+        with open(EMBEDDINGS_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return []
+
+
+def save_embedding_index(index):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_path = EMBEDDINGS_FILE + ".tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f)
+        os.replace(tmp_path, EMBEDDINGS_FILE)
+    except OSError as e:
+        logging.error(f"Error writing embedding index: {e}")
+
+
+def cosine_similarity(a, b):
+    dot = sum(x * y for x, y in zip(a, b))
+    norm_a = math.sqrt(sum(x * x for x in a))
+    norm_b = math.sqrt(sum(x * x for x in b))
+    if not norm_a or not norm_b:
+        return 0.0
+    return dot / (norm_a * norm_b)
+
+
+def semantically_cached_summary(embedding, model):
+    """
+    Return the cached summary of the nearest prior page if it is similar
+    enough (cosine >= SEMANTIC_SIMILARITY_THRESHOLD), else None. Freshness
+    and model checks are delegated to cached_summary.
+    """
+    best_key, best_sim = None, 0.0
+    for entry in load_embedding_index():
+        if entry.get("model") != model:
+            continue
+        sim = cosine_similarity(embedding, entry["embedding"])
+        if sim > best_sim:
+            best_key, best_sim = entry.get("key"), sim
+    if best_key is None or best_sim < SEMANTIC_SIMILARITY_THRESHOLD:
+        return None
+    summary = cached_summary(best_key, model)
+    if summary is not None:
+        logging.info(f"Semantic cache hit (similarity {best_sim:.3f})")
+    return summary
+
+
+def lookup_summary(key, url, model):
+    """
+    Exact-hash cache lookup, logging the hit. The semantic layer is consulted
+    separately via semantically_cached_summary once an embedding exists.
+    """
+    summary = cached_summary(key, model)
+    if summary is not None:
+        logging.info(f"Summary cache hit for {url}")
+    return summary
+
+
+def record_summary(key, url, model, summary, embedding):
+    """
+    Store a fresh summary in the exact cache and, when an embedding is
+    available, register it in the semantic index.
+    """
+    store_summary(key, url, model, summary)
+    if embedding is not None:
+        index = [e for e in load_embedding_index() if e.get("key") != key]
+        index.append({"key": key, "model": model, "embedding": embedding})
+        save_embedding_index(index)
+
+
+def summarize_website(website, model, stream=False):
+    """
+    Get a robust summary of an already-scraped Website from the OpenAI API.
+    Unchanged pages summarized within the cache TTL are served from disk
+    without spending another LLM call; near-duplicate pages are served from
+    the semantic cache.
+
+    With stream=True the summary is printed token by token as the model
+    generates it (cached summaries print at once), so the first words appear
+    in ~200ms instead of after the full generation. The complete summary is
+    returned either way.
+    """
+    key = cache_key_for(website)
+    embedding = None
+    summary = lookup_summary(key, website.url, model)
+    if summary is None:
+        embedding = embed_text(website.text)
+        if embedding is not None:
+            summary = semantically_cached_summary(embedding, model)
+    if summary is not None:
+        if stream:
+            print(summary, flush=True)
+        return summary
     try:
         response = openai.chat.completions.create(
             model=model,
-            messages=messages_for(website, system_prompt)
+            messages=messages_for(website, SYSTEM_PROMPT),
+            stream=stream
         )
-    except openai.error.OpenAIError as e:
+    except openai.OpenAIError as e:
         logging.error(f"OpenAI API error: {e}")
         sys.exit(1)
-    summary = response.choices[0].message.content
-    return website, summary
+    if stream:
+        summary_parts = []
+        for chunk in response:
+            delta = chunk.choices[0].delta.content or ""
+            print(delta, end='', flush=True)
+            summary_parts.append(delta)
+        print(flush=True)
+        summary = "".join(summary_parts)
+    else:
+        summary = response.choices[0].message.content
+    record_summary(key, website.url, model, summary, embedding)
+    return summary
+
+
+async def _embed_text_async(client, text):
+    """
+    Async twin of embed_text for the concurrent path; same truncation and
+    same return-None-on-failure contract.
+    """
+    try:
+        response = await client.embeddings.create(model=EMBEDDING_MODEL, input=text[:4000])
+    except openai.OpenAIError as e:
+        logging.error(f"OpenAI embeddings error: {e}")
+        return None
+    return response.data[0].embedding
+
+
+async def _summarize_many_async(websites, model):
+    client = openai.AsyncOpenAI()
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_LLM_CALLS)
+    index_lock = asyncio.Lock()
+
+    async def summarize_one(website):
+        key = cache_key_for(website)
+        summary = lookup_summary(key, website.url, model)
+        if summary is not None:
+            return summary
+        embedding = await _embed_text_async(client, website.text)
+        if embedding is not None:
+            summary = semantically_cached_summary(embedding, model)
+            if summary is not None:
+                return summary
+        async with semaphore:
+            try:
+                response = await client.chat.completions.create(
+                    model=model,
+                    messages=messages_for(website, SYSTEM_PROMPT)
+                )
+            except openai.OpenAIError as e:
+                logging.error(f"OpenAI API error: {e}")
+                sys.exit(1)
+        summary = response.choices[0].message.content
+        async with index_lock:
+            record_summary(key, website.url, model, summary, embedding)
+        return summary
+
+    return await asyncio.gather(*(summarize_one(w) for w in websites))
+
+
+def summarize_websites(websites, model):
+    """
+    Summarize many already-scraped Websites concurrently with AsyncOpenAI.
+    The 500-2000ms API round trips overlap instead of adding up, with a
+    semaphore capping in-flight calls. Both cache layers are consulted the
+    same way as in summarize_website. Returns summaries in input order.
+    """
+    return asyncio.run(_summarize_many_async(websites, model))
+
+
+def summarize(url, model, stream=False):
+    """
+    Given a URL, scrape the website and get a robust summary from the OpenAI API.
+    Returns both the Website object and the summary.
+    """
+    website = Website(url)
+    return website, summarize_website(website, model, stream=stream)
+
+
+def build_header(title, current_date):
+    """
+    Build the standard summary header:
+        Title
+        Date: <date>
+        By: GreyFriar
+    """
+    return f"{title}\nDate: {current_date}\nBy: GreyFriar\n\n"
 
 
-def format_summary_for_file(website, summary):
+def format_summary_for_file(website, summary, current_date=None):
     """
     Prepend the summary with a header that includes the title, current date, and attribution.
     Then append a "Links" section in markdown format if any main-story links were extracted.
@@ -245,31 +642,37 @@ def format_summary_for_file(website, summary):
         By: GreyFriar
 
     Followed by a blank line, the summary content, and finally the links section.
+    Callers that already know today's date can pass it in to avoid recomputing.
     """
-    current_date = datetime.now().strftime('%Y-%m-%d')
-    header = f"{website.title}\nDate: {current_date}\nBy: GreyFriar\n\n"
-    content = header + summary
+    if current_date is None:
+        current_date = datetime.now().strftime('%Y-%m-%d')
+    content = build_header(website.title, current_date) + summary
     if website.links:
-        content += "\n\n## Links\n"
-        for text, url in website.links:
-            content += f"- [{text}]({url})\n"
+        content += "\n\n## Links\n" + "\n".join(f"- [{text}]({url})" for text, url in website.links) + "\n"
     return content
 
 
-def save_summary(website, summary, custom_name=None):
+def save_summary(website, summary, custom_name=None, compress=False):
     """
     Save the formatted summary to a local file.
     The filename contains the current date and a sanitized version of either the website title or a custom name.
+    With compress=True the file is written gzipped as .md.gz — markdown
+    compresses ~5x, which matters once daily archives pile up.
     """
     current_date = datetime.now().strftime('%Y-%m-%d')
-    content = format_summary_for_file(website, summary)
+    content = format_summary_for_file(website, summary, current_date)
     if custom_name:
         filename = f"{current_date}_{sanitize_filename(custom_name)}.md"
     else:
         filename = f"{current_date}_{sanitize_filename(website.title)}.md"
     try:
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(content)
+        if compress:
+            filename += ".gz"
+            with gzip.open(filename, 'wt', encoding='utf-8', compresslevel=6) as f:
+                f.write(content)
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                f.write(content)
         logging.info(f"Summary saved to file: {filename}")
         print(f"{GREEN}Summary saved to file: {filename}{RESET}")
     except Exception as e:
@@ -294,15 +697,26 @@ def daily_summary(sites, model):
     Each site's summary is prefixed with its header.
     The final output is saved to a file and/or printed based on user choice.
     """
-    combined_summary = f"# Daily Summary for {datetime.now().strftime('%Y-%m-%d')}\n\n"
-    for key in sorted(sites, key=lambda x: int(x)):
-        site_info = sites[key]
-        url = site_info["url"]
-        print(f"{CYAN}Processing {url}... Please wait...{RESET}")
-        website, summary = summarize(url, model)
-        header = f"{website.title}\nDate: {datetime.now().strftime('%Y-%m-%d')}\nBy: GreyFriar\n\n"
-        combined_summary += header + summary + "\n\n---\n\n"
-    filename = f"{datetime.now().strftime('%Y-%m-%d')}_Daily_Summary.md"
+    today_str = datetime.now().strftime('%Y-%m-%d')
+    # Collect pieces in a list and join once; += on a growing string is quadratic.
+    parts = [f"# Daily Summary for {today_str}\n\n"]
+    ordered = [sites[key] for key in sorted(sites, key=lambda x: int(x))]
+    urls = [site_info["url"] for site_info in ordered]
+    print(f"{CYAN}Fetching {len(urls)} sites concurrently... Please wait...{RESET}")
+    pages = fetch_all(urls)
+    # Parse in a thread pool: Lexbor is a C parser that releases the GIL,
+    # so the CPU-bound parse stage spreads across cores. max_workers must
+    # stay positive even when every site has been removed from the list.
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(urls)))) as executor:
+        websites = list(executor.map(Website, urls, pages))
+    print(f"{CYAN}Summarizing {len(websites)} sites concurrently... Please wait...{RESET}")
+    summaries = summarize_websites(websites, model)
+    for website, summary in zip(websites, summaries):
+        parts.append(build_header(website.title, today_str))
+        parts.append(summary)
+        parts.append("\n\n---\n\n")
+    combined_summary = "".join(parts)
+    filename = f"{today_str}_Daily_Summary.md"
     option = choose_output_destination()
     if option in ["2", "3"]:
         try:
@@ -317,32 +731,40 @@ def daily_summary(sites, model):
         print(combined_summary)
 
 
+# Static parts of the welcome screen, colored once at import time.
+MENU_HEADER = f"""{CYAN}
+     _____               ______    _
+    |  __ \              |  ___|  (_)
+    | |  \/_ __ ___ _   _| |_ _ __ _  __ _ _ __
+    | | __| '__/ _ \ | | |  _| '__| |/ _` | '__|
+    | |_\ \ | |  __/ |_| | | | |  | | (_| | |
+     \____/_|  \___|\__, \_| |_|  |_|\__,_|_|
+                    __/ |
+                   |___/
+             Cyber Security News
+{RESET}"""
+MENU_PROMPT = f"{YELLOW}Please choose an option:{RESET}"
+MENU_STATIC_OPTIONS = (
+    f"{green_bracket('5')} Enter your own site URL",
+    f"{green_bracket('6')} Generate a daily summary from all default sites",
+    f"{green_bracket('7')} Add another site to the default sites list",
+    f"{green_bracket('8')} Remove a site from the default sites list",
+    f"{green_bracket('0')} End/Exit the program",
+)
+
+
 def print_welcome_menu(sites):
     """
     Print the welcome screen with ASCII art and the colored menu options.
+    The whole screen goes out as one write instead of a print per line.
     """
-    header = f"""{CYAN}
-     _____               ______    _            
-    |  __ \              |  ___|  (_)           
-    | |  \/_ __ ___ _   _| |_ _ __ _  __ _ _ __ 
-    | | __| '__/ _ \ | | |  _| '__| |/ _` | '__|
-    | |_\ \ | |  __/ |_| | | | |  | | (_| | |   
-     \____/_|  \___|\__, \_| |_|  |_|\__,_|_|   
-                    __/ |                      
-                   |___/   
-             Cyber Security News                    
-{RESET}"""
-    print(header)
-    print(f"{YELLOW}Please choose an option:{RESET}")
+    lines = [MENU_HEADER, MENU_PROMPT]
     for key in sorted(sites, key=lambda x: int(x)):
         site_info = sites[key]
-        print(f"{GREEN}[{key}]{RESET} Summarize {site_info['url']} ({site_info['name']})")
-    print(f"{GREEN}[5]{RESET} Enter your own site URL")
-    print(f"{GREEN}[6]{RESET} Generate a daily summary from all default sites")
-    print(f"{GREEN}[7]{RESET} Add another site to the default sites list")
-    print(f"{GREEN}[8]{RESET} Remove a site from the default sites list")
-    print(f"{GREEN}[0]{RESET} End/Exit the program")
-    print()
+        lines.append(f"{green_bracket(key)} Summarize {site_info['url']} ({site_info['name']})")
+    lines.extend(MENU_STATIC_OPTIONS)
+    lines.append("")
+    print("\n".join(lines))
 
 
 def main():
@@ -361,64 +783,72 @@ def main():
     # Load persisted sites from file.
     sites = load_sites()
 
-    while True:
-        print_welcome_menu(sites)
-        choice = input(f"{BLUE}Enter your choice: {RESET}").strip().lower()
-        if choice in ["0", "end"]:
-            print(f"{MAGENTA}Exiting. Goodbye!{RESET}")
-            break
-        elif choice in sites:
-            site_info = sites[choice]
-            url = site_info["url"]
-            print(f"{CYAN}Processing {url}... Please wait...{RESET}")
-            website, summary = summarize(url, model)
-            option = choose_output_destination()
-            if option in ["1", "3"]:
-                print(f"\n{YELLOW}Summary:{RESET}\n")
-                print(summary)
-            if option in ["2", "3"]:
-                save_summary(website, summary)
-        elif choice == "5":
-            url = input(f"{BLUE}Enter the site URL: {RESET}").strip()
-            if url:
-                print(f"{CYAN}Processing {url}... Please wait...{RESET}")
-                website, summary = summarize(url, model)
+    # Mutations only mark the list dirty; it is flushed once on exit.
+    sites_dirty = False
+    try:
+        while True:
+            print_welcome_menu(sites)
+            choice = input(f"{BLUE}Enter your choice: {RESET}").strip().lower()
+            if choice in ["0", "end"]:
+                print(f"{MAGENTA}Exiting. Goodbye!{RESET}")
+                break
+            elif choice in sites:
+                site_info = sites[choice]
+                url = site_info["url"]
+                # Ask for the destination up front so screen output can stream
+                # while the model is still generating.
                 option = choose_output_destination()
-                if option in ["1", "3"]:
+                stream = option in ["1", "3"]
+                print(f"{CYAN}Processing {url}... Please wait...{RESET}")
+                if stream:
                     print(f"\n{YELLOW}Summary:{RESET}\n")
-                    print(summary)
+                website, summary = summarize(url, model, stream=stream)
                 if option in ["2", "3"]:
                     save_summary(website, summary)
+            elif choice == "5":
+                url = input(f"{BLUE}Enter the site URL: {RESET}").strip()
+                if url:
+                    option = choose_output_destination()
+                    stream = option in ["1", "3"]
+                    print(f"{CYAN}Processing {url}... Please wait...{RESET}")
+                    if stream:
+                        print(f"\n{YELLOW}Summary:{RESET}\n")
+                    website, summary = summarize(url, model, stream=stream)
+                    if option in ["2", "3"]:
+                        save_summary(website, summary)
+                else:
+                    print(f"{RED}No URL provided.{RESET}")
+            elif choice == "6":
+                daily_summary(sites, model)
+            elif choice == "7":
+                new_url = input(f"{BLUE}Enter the URL to add: {RESET}").strip()
+                if not new_url:
+                    print(f"{RED}No URL provided. Returning to menu.{RESET}")
+                    continue
+                new_name = input(f"{BLUE}Enter a name for this site (optional): {RESET}").strip()
+                if not new_name:
+                    new_name = new_url  # fallback if no name provided
+                next_key = str(max([int(k) for k in sites.keys()] + [0]) + 1)
+                sites[next_key] = {"url": new_url, "name": new_name}
+                sites_dirty = True
+                print(f"{GREEN}Site added successfully as option [{next_key}].{RESET}")
+            elif choice == "8":
+                # List current sites and ask which one to remove.
+                print(f"{YELLOW}Current sites:{RESET}")
+                for key in sorted(sites, key=lambda x: int(x)):
+                    print(f"{GREEN}[{key}]{RESET} {sites[key]['name']} ({sites[key]['url']})")
+                rem_key = input(f"{BLUE}Enter the option number to remove (or press Enter to cancel): {RESET}").strip()
+                if rem_key in sites:
+                    removed = sites.pop(rem_key)
+                    sites_dirty = True
+                    print(f"{GREEN}Removed site: {removed['name']} ({removed['url']}).{RESET}")
+                else:
+                    print(f"{RED}Invalid option. No site removed.{RESET}")
             else:
-                print(f"{RED}No URL provided.{RESET}")
-        elif choice == "6":
-            daily_summary(sites, model)
-        elif choice == "7":
-            new_url = input(f"{BLUE}Enter the URL to add: {RESET}").strip()
-            if not new_url:
-                print(f"{RED}No URL provided. Returning to menu.{RESET}")
-                continue
-            new_name = input(f"{BLUE}Enter a name for this site (optional): {RESET}").strip()
-            if not new_name:
-                new_name = new_url  # fallback if no name provided
-            next_key = str(max([int(k) for k in sites.keys()] + [0]) + 1)
-            sites[next_key] = {"url": new_url, "name": new_name}
+                print(f"{RED}Invalid choice. Please try again.{RESET}")
+    finally:
+        if sites_dirty:
             save_sites(sites)
-            print(f"{GREEN}Site added successfully as option [{next_key}].{RESET}")
-        elif choice == "8":
-            # List current sites and ask which one to remove.
-            print(f"{YELLOW}Current sites:{RESET}")
-            for key in sorted(sites, key=lambda x: int(x)):
-                print(f"{GREEN}[{key}]{RESET} {sites[key]['name']} ({sites[key]['url']})")
-            rem_key = input(f"{BLUE}Enter the option number to remove (or press Enter to cancel): {RESET}").strip()
-            if rem_key in sites:
-                removed = sites.pop(rem_key)
-                save_sites(sites)
-                print(f"{GREEN}Removed site: {removed['name']} ({removed['url']}).{RESET}")
-            else:
-                print(f"{RED}Invalid option. No site removed.{RESET}")
-        else:
-            print(f"{RED}Invalid choice. Please try again.{RESET}")
 
 if __name__ == '__main__':
     main()